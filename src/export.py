@@ -0,0 +1,30 @@
+"""
+Entry point for exporting all IIIF Manifests to a directory tree that can be served by a web server.
+
+As for the api, the configuration file is passed via the CONFIG_YML environment variable
+and the SPARQL endpoint via the SPARQL_ENDPOINT environment variable.
+
+To run the export, use a command like 'python export.py /export'.
+"""
+
+import argparse
+import os
+import sys
+
+from lib.StaticExporter import StaticExporter
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Export all IIIF Manifests to a directory')
+    parser.add_argument('outputDirectory', help='Directory to write the manifests to')
+    parser.add_argument('--processes', type=int, default=None, help='Number of worker processes (default: number of CPUs)')
+    args = parser.parse_args()
+
+    exporter = StaticExporter(
+        configYmlPath=os.environ['CONFIG_YML'],
+        sparqlEndpoint=os.environ['SPARQL_ENDPOINT'],
+        outputDirectory=args.outputDirectory,
+        processes=args.processes)
+    summary = exporter.export()
+    print(f"Exported {summary['exported']} manifests ({summary['changed']} changed, {summary['failed']} failed)")
+    if summary['failed'] > 0:
+        sys.exit(1)
@@ -6,6 +6,8 @@ Usage:
     manifest = api.getManifest(type="example", id="123")
 """
 
+import hashlib
+import json
 import os
 import yaml
 import sys
@@ -66,7 +68,9 @@ class Api:
         self.connector.loadFieldDefinitionsFromFile(self.config['fieldDefinitionsFile'])
 
         cache.setExpiration(self.config['cache']['expiration'])
-        
+        if self.config['cache'].get('fingerprint'):
+            self.configFingerprint = self._getConfigFingerprint()
+            cache.setFingerprintFunction(Api.getFingerprint)
 
     @cache.cache
     def getManifest(self, *, type: str, id: str) -> dict:
@@ -83,6 +87,42 @@ class Api:
             thumbnails=data['thumbnails']
         )
 
+    def getObjects(self) -> list:
+        """
+        Return the type and ID of all objects selected by the export query.
+        Subjects outside of the entities namespace or whose ID contains a '/' are ignored.
+        """
+        namespace = self.config['namespaces']['entities']
+        objects = []
+        # Deduplicate subjects while keeping their order
+        for subject in dict.fromkeys(self.connector.getSubjects(self.config['export']['query'])):
+            if not subject.startswith(namespace):
+                continue
+            type, _, id = subject[len(namespace):].partition('/')
+            if type and id and '/' not in id:
+                objects.append((type, id))
+        return objects
+
+    def getFingerprint(self, *, type: str, id: str) -> str:
+        subject = f"{self.config['namespaces']['entities']}{type}/{id}"
+        dataFingerprint = self.connector.getFingerprintForSubject(subject, self.config['cache']['fingerprint'])
+        if dataFingerprint is None:
+            return None
+        # Combine with the configuration so that configuration changes force regeneration
+        return hashlib.sha256(f"{self.configFingerprint}\n{dataFingerprint}".encode()).hexdigest()
+
+    def _getConfigFingerprint(self) -> str:
+        """
+        Return a hash of the configuration that shapes the generated manifests,
+        including the contents of the field definitions file and the fingerprint query.
+        """
+        config = {key: value for key, value in self.config.items() if key != 'cache'}
+        config['cache'] = {'fingerprint': self.config['cache']['fingerprint']}
+        with open(self.config['fieldDefinitionsFile'], 'rb') as f:
+            fieldDefinitions = hashlib.sha256(f.read()).hexdigest()
+        content = json.dumps({"config": config, "fieldDefinitions": fieldDefinitions}, sort_keys=True, default=str)
+        return hashlib.sha256(content.encode()).hexdigest()
+
     def getDataForSubject(self, subject: str) -> dict:
         label = self.connector.getLabelForSubject(subject)
         metadata = self.connector.getMetadataForSubject(subject)
@@ -1,4 +1,4 @@
-from os import remove as removeFile
+from os import remove as removeFile, utime
 from os.path import exists, getmtime, join
 
 import json
@@ -10,6 +10,7 @@ class Cache:
     def __init__(self, path: str, *, expiration: str = '1w'):
         self.cacheDirectory = path
         self.cacheExpiration = self._parseTimeString(expiration)
+        self.fingerprintFunction = None
 
     def cache(self, func):
         def wrapper(*args, **kwargs):
@@ -22,21 +23,41 @@ class Cache:
 
             if self._isInCache(key):
                 return self._retrieveFromCache(key)
-            else:
-                value = func(*args, **kwargs)
-                self._storeInCache(key, value)
-                return value
+
+            # The entry is missing or expired. If the underlying data has not
+            # changed since the entry was stored, renew it instead of regenerating
+            fingerprint = None
+            if self.fingerprintFunction is not None:
+                try:
+                    fingerprint = self.fingerprintFunction(*args, **kwargs)
+                except Exception as e:
+                    # Fall back to regenerating if the fingerprint cannot be determined
+                    print(e)
+                    fingerprint = None
+                if fingerprint is not None and self._hasFingerprint(key, fingerprint):
+                    self._renewInCache(key)
+                    return self._retrieveFromCache(key)
+
+            value = func(*args, **kwargs)
+            self._storeInCache(key, value, fingerprint=fingerprint)
+            return value
         return wrapper
     
     def setExpiration(self, expiration: str):
         self.cacheExpiration = self._parseTimeString(expiration)
 
-    def _deleteIfExpired(self, key):
-        filepath = self._generateFilePath(key)
-        if exists(filepath):
-            lastModified = getmtime(filepath)
-            if lastModified + self.cacheExpiration < time.time():
-                removeFile(filepath)
+    def setFingerprintFunction(self, func):
+        """
+        Set a function that returns a fingerprint of the data behind a cache entry.
+        The function is called with the same arguments as the cached function and
+        should return a string, or None if no fingerprint can be determined.
+        Expired entries whose fingerprint is unchanged are renewed instead of regenerated.
+        """
+        self.fingerprintFunction = func
+
+    def _isExpired(self, key):
+        lastModified = getmtime(self._generateFilePath(key))
+        return lastModified + self.cacheExpiration < time.time()
     
     def _generateFilePath(self, key):
         return join(self.cacheDirectory, self._generateFilename(key))
@@ -45,9 +66,21 @@ class Cache:
         keyHash = hashlib.sha256(key.encode()).hexdigest()
         return str(keyHash) + '.pickle'
 
+    def _generateFingerprintFilePath(self, key):
+        return self._generateFilePath(key) + '.fingerprint'
+
+    def _hasFingerprint(self, key, fingerprint):
+        filepath = self._generateFingerprintFilePath(key)
+        if not exists(self._generateFilePath(key)) or not exists(filepath):
+            return False
+        with open(filepath, 'r') as f:
+            return f.read() == fingerprint
+
     def _isInCache(self, key):
-        self._deleteIfExpired(key)
-        return exists(self._generateFilePath(key))
+        return exists(self._generateFilePath(key)) and not self._isExpired(key)
+
+    def _renewInCache(self, key):
+        utime(self._generateFilePath(key))
     
     def _retrieveFromCache(self, key):
         filepath = self._generateFilePath(key)
@@ -56,10 +89,16 @@ class Cache:
                 value = pickle.load(f)
                 return value
         
-    def _storeInCache(self, key, value):
+    def _storeInCache(self, key, value, *, fingerprint=None):
         filepath = self._generateFilePath(key)
         with open(filepath, 'wb') as f:
             pickle.dump(value, f)
+        fingerprintFilepath = self._generateFingerprintFilePath(key)
+        if fingerprint is not None:
+            with open(fingerprintFilepath, 'w') as f:
+                f.write(fingerprint)
+        elif exists(fingerprintFilepath):
+            removeFile(fingerprintFilepath)
     
     def _parseTimeString(self, timeStr: str):
         unitMap = {
@@ -26,6 +26,12 @@ Methods:
     getMetadataForSubject(subject: str) -> dict
         Get the values for all fields for a given URI.
 
+    getFingerprintForSubject(subject: str, fingerprintQueryTemplate: str) -> str
+        Get a fingerprint of the data for a URI, computed as a hash of the results of the fingerprint query.
+
+    getSubjects(query: str) -> list
+        Get the URIs returned as ?subject by a SPARQL SELECT query.
+
     setLabelQueryTemplate(template: str)
         Set the template for the label query. Provide a SPARQL SELECT query with a $subject placeholder and a ?label variable.
 
@@ -33,6 +39,8 @@ Methods:
         Set the template for the image query. Provide a SPARQL SELECT query with a $subject placeholder and ?image, ?width, and ?height variables.       
 """
 
+import hashlib
+import json
 import os
 import yaml
 from SPARQLWrapper import SPARQLWrapper, JSON
@@ -124,6 +132,27 @@ class FieldConnector:
                     self.fields[d['id']]['domain'] = d['domain']
             self.namespaces = fieldDefinitions['namespaces']
 
+    def getFingerprintForSubject(self, subject: str, fingerprintQueryTemplate: str) -> str:
+        """
+        Get a fingerprint of the data for a URI.
+        The fingerprint is a hash of the raw bindings returned by the fingerprint query,
+        independent of the order in which the rows are returned.
+        Returns None if the query returns no results.
+        """
+        template = Template(fingerprintQueryTemplate)
+        query = template.substitute(subject=f"<{subject}>")
+        self.sparql.setQuery(query)
+        try:
+            queryResult = self.sparql.query().convert()
+        except Exception as e:
+            print(e)
+            raise Exception("Could not execute query: %s" % query)
+        bindings = queryResult["results"]["bindings"]
+        if len(bindings) == 0:
+            return None
+        rows = sorted(json.dumps(row, sort_keys=True) for row in bindings)
+        return hashlib.sha256('\n'.join(rows).encode()).hexdigest()
+
     def getImagesForSubject(self, subject: str) -> list:
         """
         Get images for a given URI.
@@ -237,6 +266,18 @@ class FieldConnector:
                 })
         return metadata
     
+    def getSubjects(self, query: str) -> list:
+        """
+        Get the URIs returned as ?subject by a SPARQL SELECT query.
+        """
+        self.sparql.setQuery(query)
+        try:
+            queryResult = self.sparql.query().convert()
+        except Exception as e:
+            print(e)
+            raise Exception("Could not execute query: %s" % query)
+        return [row['subject'] for row in self._sparqlResultToDict(queryResult) if 'subject' in row]
+
     def getThumbnailsForSubject(self, subject: str) -> list:
         """
         Get thumbnails for a given URI.
@@ -22,7 +22,7 @@ Usage:
 """
 
 import json
-from iiif_prezi3 import Canvas, Manifest, Annotation, AnnotationPage, ResourceItem
+from iiif_prezi3 import Canvas, Collection, Manifest, ManifestRef, CollectionRef, Annotation, AnnotationPage, ResourceItem
 class IiifManifestGenerator:
 
     def __init__(self, *, baseUri: str = "http://example.org/manifests/"):
@@ -57,6 +57,28 @@ class IiifManifestGenerator:
         return json.loads(manifest.json(indent=2))
     
     
+    def generateCollection(self, *, id: str, label: str, manifests: list = None, collections: list = None) -> dict:
+        """
+        Generate a IIIF Presentation API collection.
+
+        :param id: The ID of the collection, relative to the base URI.
+        :param label: The label of the collection.
+        :param manifests: A list of manifests. Each manifest should be a dict with the keys 'id' and 'label'.
+        :param collections: A list of sub-collections. Each collection should be a dict with the keys 'id' and 'label'.
+
+        :return: A dict representing the collection.
+        """
+        collection = Collection(id=f"{self.baseUri}{id}", label=label)
+        items = []
+        for item in collections or []:
+            items.append(CollectionRef(id=item['id'], label=item['label'], type="Collection"))
+        for item in manifests or []:
+            items.append(ManifestRef(id=item['id'], label=item['label'], type="Manifest"))
+        collection.items = items
+
+        # Return collection as parsed JSON
+        return json.loads(collection.json(indent=2))
+
     def generateImageItems(self, images: list, manifestId: str) -> list:
         """
         Generate a list of image items following the IIIF Presentation API standard.
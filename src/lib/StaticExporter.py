@@ -0,0 +1,175 @@
+"""
+Class that exports the IIIF Manifests of all objects to a directory tree that can be served by a web server.
+
+The manifests are written to '{output directory}/{manifests namespace path}/{type}/{id}' as compact JSON,
+together with a gzip compressed sibling ('{id}.gz') and a IIIF Collection for every type ('{type}/index.json')
+as well as for all types ('index.json'). Files are written atomically and only if their content has changed,
+so that repeated exports only touch the manifests of objects whose data has changed.
+
+The objects to export are selected using the 'export.query' of the configuration file.
+
+Usage:
+    exporter = StaticExporter(configYmlPath="config.yml", sparqlEndpoint="http://example.org/sparql", outputDirectory="/export")
+    summary = exporter.export()
+"""
+
+import gzip
+import json
+import os
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from urllib.parse import urlparse
+
+from lib.Api import Api
+
+# Api instance of the current worker process
+workerApi = None
+
+def _initWorker(configYmlPath: str, sparqlEndpoint: str):
+    global workerApi
+    workerApi = Api(configYmlPath, sparqlEndpoint)
+
+def _exportManifest(outputPath: str, type: str, id: str):
+    try:
+        manifest = workerApi.getManifest(type=type, id=id)
+        changed = writeJson(os.path.join(outputPath, type, id), manifest)
+    except Exception as e:
+        print(f"Error: Could not export manifest '{type}/{id}': {e}", file=sys.stderr)
+        return None
+    return {
+        "type": type,
+        "id": manifest['id'],
+        "label": manifest['label'],
+        "changed": changed
+    }
+
+def writeJson(filepath: str, data: dict) -> bool:
+    """
+    Write data as compact JSON to a file, together with a gzip compressed sibling.
+    The files are only written if their content has changed, or if the compressed
+    file is missing or older than the JSON file (e.g. after an interrupted export).
+
+    :return: True if the files were written, False if they were unchanged.
+    """
+    content = json.dumps(data, ensure_ascii=False, separators=(',', ':')).encode()
+    gzipFilepath = filepath + '.gz'
+    unchanged = False
+    if os.path.isfile(filepath):
+        with open(filepath, 'rb') as f:
+            unchanged = f.read() == content
+    if not unchanged:
+        _writeAtomically(filepath, content)
+    elif os.path.isfile(gzipFilepath) and os.path.getmtime(gzipFilepath) >= os.path.getmtime(filepath):
+        return False
+    # Fix the timestamp in the gzip header so that the compressed file is reproducible
+    _writeAtomically(gzipFilepath, gzip.compress(content, compresslevel=9, mtime=0))
+    return True
+
+def _writeAtomically(filepath: str, content: bytes):
+    directory = os.path.dirname(filepath)
+    os.makedirs(directory, exist_ok=True)
+    fd, tmpPath = tempfile.mkstemp(dir=directory, prefix='.tmp-')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(content)
+        os.chmod(tmpPath, 0o644)
+        os.replace(tmpPath, filepath)
+    except:
+        os.remove(tmpPath)
+        raise
+
+class StaticExporter:
+
+    def __init__(self, *, configYmlPath: str, sparqlEndpoint: str, outputDirectory: str, processes: int = None):
+        self.configYmlPath = configYmlPath
+        self.sparqlEndpoint = sparqlEndpoint
+        self.processes = processes
+        self.api = Api(configYmlPath, sparqlEndpoint)
+
+        if not self.api.config.get('export', {}).get('query'):
+            print(f"Error: Missing required parameter 'export.query' in configuration file '{configYmlPath}'", file=sys.stderr)
+            sys.exit(1)
+
+        # Mirror the path of the manifests namespace so that the files can be served under the manifest URIs
+        manifestsPath = urlparse(self.api.config['namespaces']['manifests']).path.strip('/')
+        self.outputPath = os.path.join(outputDirectory, manifestsPath)
+
+    def export(self) -> dict:
+        """
+        Export the manifests of all objects and the collections indexing them.
+
+        :return: A dict with the number of exported, changed and failed manifests.
+        """
+        objects = self.api.getObjects()
+        manifests = {}
+        exported = 0
+        changed = 0
+        try:
+            with ProcessPoolExecutor(max_workers=self.processes, initializer=_initWorker, initargs=(self.configYmlPath, self.sparqlEndpoint)) as executor:
+                results = executor.map(_exportManifest,
+                                       [self.outputPath] * len(objects),
+                                       [type for type, _ in objects],
+                                       [id for _, id in objects],
+                                       chunksize=max(1, len(objects) // (4 * (self.processes or os.cpu_count() or 1))))
+                for (type, id), result in zip(objects, results):
+                    if result is None:
+                        # Keep previously exported manifests of failed objects in the collections
+                        result = self._readExportedManifest(type, id)
+                        if result is None:
+                            continue
+                    else:
+                        exported += 1
+                        if result['changed']:
+                            changed += 1
+                    manifests.setdefault(result['type'], []).append(result)
+        except BrokenProcessPool as e:
+            print(f"Error: Export aborted because a worker process failed: {e}", file=sys.stderr)
+            sys.exit(1)
+
+        self.exportCollections(manifests)
+        return {
+            "exported": exported,
+            "changed": changed,
+            "failed": len(objects) - exported
+        }
+
+    def _readExportedManifest(self, type: str, id: str) -> dict:
+        """
+        Read the ID and label of a previously exported manifest, or return None if it does not exist.
+        """
+        filepath = os.path.join(self.outputPath, type, id)
+        if not os.path.isfile(filepath):
+            return None
+        try:
+            with open(filepath, 'r') as f:
+                manifest = json.load(f)
+            return {
+                "type": type,
+                "id": manifest['id'],
+                "label": manifest['label'],
+                "changed": False
+            }
+        except (OSError, ValueError, KeyError) as e:
+            print(f"Error: Could not read exported manifest '{type}/{id}': {e}", file=sys.stderr)
+            return None
+
+    def exportCollections(self, manifests: dict):
+        """
+        Export a collection for every type and a collection of all types.
+
+        :param manifests: A dict mapping each type to a list of manifests with the keys 'id' and 'label'.
+        """
+        generator = self.api.manifest
+        collections = []
+        for type in sorted(manifests.keys()):
+            items = sorted(manifests[type], key=lambda item: item['id'])
+            collection = generator.generateCollection(id=f"{type}/", label=type, manifests=items)
+            writeJson(os.path.join(self.outputPath, type, 'index.json'), collection)
+            collections.append({
+                "id": collection['id'],
+                "label": collection['label']
+            })
+        collection = generator.generateCollection(id="", label="Manifests", collections=collections)
+        writeJson(os.path.join(self.outputPath, 'index.json'), collection)